@@ -39,19 +39,30 @@ def flatten(iterable: Iterable, depth: int = -1) -> Iterator:
                         to flatten all levels.
     :return:            A flattening iterator over the iterable.
     """
-    # Process each element of the iterable in turn
-    for element in iterable:
-        # Try to get an iterator for the element
-        element_iter = safe_iter(element)
-
-        # If the element isn't iterable or we've reached depth, yield the element itself
-        if element_iter is None or depth == 0:
-            yield element
-
-        # Otherwise yield each sub-element of the flattened element
+    # Keep a stack of the nested iterators being flattened (with their remaining depths)
+    # instead of recursing, so elements aren't passed up through a generator per level
+    stack = [(iter(iterable), depth)]
+    while len(stack) > 0:
+        iterator, depth = stack[-1]
+
+        # Process each element of the innermost iterable in turn
+        for element in iterator:
+            # Try to get an iterator for the element
+            element_iter = safe_iter(element)
+
+            # If the element isn't iterable or we've reached depth, yield the element itself.
+            # Single characters iterate to themselves, so can't be flattened any further
+            if element_iter is None or depth == 0 or (isinstance(element, str) and len(element) == 1):
+                yield element
+
+            # Otherwise descend into the element, resuming this iterator once it is exhausted
+            else:
+                stack.append((element_iter, depth - 1))
+                break
+
+        # The innermost iterator is exhausted
         else:
-            for sub_element in flatten(element_iter, depth - 1):
-                yield sub_element
+            stack.pop()
 
 
 def invert_indices(indices: Iterable[int], size: int) -> Iterator[int]:
@@ -8,8 +8,11 @@ from ._standard_application_root_logger import (
     INFO_HANDLER_NAME,
     WARNING_HANDLER_NAME,
     ERROR_HANDLER_NAME,
+    DEBUG_FORMAT_STRING,
+    STANDARD_FORMAT_STRING,
     exact_level_filter,
     create_standard_handler,
+    get_standard_formatter,
     create_standard_application_root_logger
 )
 from ._standard_library_root_logger import create_standard_library_root_logger
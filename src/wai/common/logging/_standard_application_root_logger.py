@@ -12,6 +12,11 @@ INFO_HANDLER_NAME = "info_handler"
 WARNING_HANDLER_NAME = "warning_handler"
 ERROR_HANDLER_NAME = "error_handler"
 
+# The format strings for the default handlers
+DEBUG_FORMAT_STRING = "{levelname:8} {created:023} - {name} - {lineno} - {funcName} - {pathname}\n" \
+                      "{message}"
+STANDARD_FORMAT_STRING = "{levelname:8} {asctime:23} - {name} - {message}"
+
 
 def exact_level_filter(level: int) -> Callable[[logging.LogRecord], bool]:
     """
@@ -53,11 +58,23 @@ def create_standard_handler(std_out: bool,
         handler.addFilter(exact_level_filter(level))
 
     # Add the message format
+    handler.setFormatter(get_standard_formatter(format_string))
+
+    return handler
+
+
+def get_standard_formatter(format_string: str) -> logging.Formatter:
+    """
+    Creates a standard formatter for the given format string. Each call
+    creates a new formatter, so handlers can each configure their own.
+
+    :param format_string:   The format string for the log messages, in '{' style.
+    :return:                The formatter.
+    """
     formatter = logging.Formatter(format_string, style="{")
     formatter.default_msec_format = "%s.%03d"
-    handler.setFormatter(formatter)
 
-    return handler
+    return formatter
 
 
 def create_standard_application_root_logger() -> logging.Logger:
@@ -81,8 +98,7 @@ def create_standard_application_root_logger() -> logging.Logger:
         True,
         DEBUG_HANDLER_NAME,
         logging.DEBUG,
-        "{levelname:8} {created:023} - {name} - {lineno} - {funcName} - {pathname}\n"
-        "{message}"
+        DEBUG_FORMAT_STRING
     )
 
     # Create an info handler to print info messages to std-out
@@ -90,7 +106,7 @@ def create_standard_application_root_logger() -> logging.Logger:
         True,
         INFO_HANDLER_NAME,
         logging.INFO,
-        "{levelname:8} {asctime:23} - {name} - {message}"
+        STANDARD_FORMAT_STRING
     )
 
     # Create a warning handler to print warning messages to std-err
@@ -98,7 +114,7 @@ def create_standard_application_root_logger() -> logging.Logger:
         False,
         WARNING_HANDLER_NAME,
         logging.WARNING,
-        "{levelname:8} {asctime:23} - {name} - {message}"
+        STANDARD_FORMAT_STRING
     )
 
     # Create a final handler to print all error/critical messages to std-err
@@ -106,7 +122,7 @@ def create_standard_application_root_logger() -> logging.Logger:
         False,
         ERROR_HANDLER_NAME,
         logging.ERROR,
-        "{levelname:8} {asctime:23} - {name} - {message}",
+        STANDARD_FORMAT_STRING,
         False
     )
 
@@ -1,3 +1,9 @@
+import math
+
+# math.perm is implemented in C, but was only added in Python 3.8
+_HAS_PERM: bool = hasattr(math, "perm")
+
+
 def factorial(
         of: int,
         down_to: int = 0
@@ -20,6 +26,13 @@ def factorial(
     if of < down_to:
         raise ArithmeticError(f"'of' must be at least 'down_to', got 'of = {of}, 'down_to' = {down_to}")
 
+    # Defer to the C implementations where possible (they only accept ints)
+    if isinstance(of, int) and isinstance(down_to, int):
+        if down_to == 0:
+            return math.factorial(of)
+        if _HAS_PERM:
+            return math.perm(of, of - down_to)
+
     result = 1
     while of > down_to:
         result *= of
@@ -1,5 +1,29 @@
+import math
+
 from .._factorial import factorial
 
+# math.comb is implemented in C, but was only added in Python 3.8
+_HAS_COMB: bool = hasattr(math, "comb")
+
+
+def _perm(n: int, k: int) -> int:
+    # factorial defers to math.perm itself where it can
+    return factorial(n, n - k)
+
+
+def _comb(n: int, k: int) -> int:
+    # Defer to the C implementation where possible (it only accepts ints)
+    if _HAS_COMB and isinstance(n, int) and isinstance(k, int):
+        return math.comb(n, k)
+
+    # We discriminate on the difference between n and k to determine
+    # the least number of multiplications to perform
+    remainder = n - k
+    if k > remainder:
+        return factorial(n, k) // factorial(remainder)
+    else:
+        return factorial(n, remainder) // factorial(k)
+
 
 def number_of_subsets(
         set_size: int,
@@ -55,13 +79,7 @@ def number_of_subsets(
 
     # If order matters, (n, k) = n! / (n - k)! (without reselection)
     if order_matters:
-        return factorial(set_size, set_size - subset_size)
+        return _perm(set_size, subset_size)
 
-    # Otherwise, (n, k) = n! / k!(n - k)! (again, without reselection).
-    # We discriminate on the difference between n and k to determine
-    # the least number of multiplications to perform
-    remainder_size = set_size - subset_size
-    if subset_size > remainder_size:
-        return factorial(set_size, subset_size) // factorial(remainder_size)
-    else:
-        return factorial(set_size, remainder_size) // factorial(subset_size)
+    # Otherwise, (n, k) = n! / k!(n - k)! (again, without reselection)
+    return _comb(set_size, subset_size)
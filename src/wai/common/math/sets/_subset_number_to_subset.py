@@ -1,3 +1,5 @@
+from bisect import insort
+from collections import Counter
 from typing import List
 
 from ._number_of_subsets import number_of_subsets
@@ -62,16 +64,27 @@ def subset_number_to_subset(
 
         # Without reselection, the items available for selection reduces by 1 at each iteration
         else:
+            # Each digit is the rank of the selected item amongst those not yet selected,
+            # with the first-selected item in the most-significant position
+            ranks = []
             factor = set_size - subset_size + 1
-            while len(subset) < subset_size:
-                next = subset_number % factor
+            while len(ranks) < subset_size:
+                ranks.append(subset_number % factor)
                 subset_number //= factor
-                for index in range(len(subset)):
-                    if subset[index] >= next:
-                        subset[index] += 1
-                subset.insert(0, next)
                 factor += 1
 
+            # Convert each rank back to its item by skipping over the (smaller) items
+            # already selected, in ascending order
+            selected = []
+            for rank in reversed(ranks):
+                value = rank
+                for selected_value in selected:
+                    if selected_value > value:
+                        break
+                    value += 1
+                insort(selected, value)
+                subset.append(value)
+
         return subset
 
     # If reselect is allowed, we are expecting the equivalent binomial representation of the selection
@@ -83,10 +96,15 @@ def subset_number_to_subset(
     num_subsets = number_of_subsets(set_size - 1, subset_size)
     k = subset_size
     for n in reversed(range(set_size)):
+        # Once the subset number is exhausted, the remaining items are the k smallest,
+        # so we can skip the (potentially big-int) updates for the rest of the range
+        if subset_number == 0:
+            subset.extend(reversed(range(k)))
+            break
         if subset_number >= num_subsets:
             subset_number -= num_subsets
             subset.append(n)
-            if len(subset) == subset_size:
+            if k == 1:
                 break
             num_subsets = num_subsets * k // n
             k -= 1
@@ -98,7 +116,7 @@ def subset_number_to_subset(
         subset.sort()
         subset_size = set_size - subset_size
         set_size -= subset_size - 1
-        counts = {}
+        counts = Counter()
         total = 0
         for i in range(set_size - 1):
             last = -1 if i == 0 else subset[i - 1]
@@ -108,9 +126,6 @@ def subset_number_to_subset(
                 counts[i] = count
         if total < subset_size:
             counts[set_size - 1] = subset_size - total
-        subset = []
-        for value, count in counts.items():
-            for i in range(count):
-                subset.append(value)
+        subset = list(counts.elements())
 
     return subset
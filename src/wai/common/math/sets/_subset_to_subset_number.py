@@ -1,3 +1,6 @@
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import accumulate
 from typing import List
 
 from ._number_of_subsets import number_of_subsets
@@ -49,21 +52,22 @@ def subset_to_subset_number(
 
     # Handle reselection separately
     if can_reselect:
-        # If order matters, shift-encode each value in order
+        # If order matters, shift-encode each value in order (using Horner's
+        # method to avoid recalculating the powers of the set-size)
         if order_matters:
-            return sum(
-                value * (set_size ** index)
-                for index, value in enumerate(subset)
-            )
+            result = 0
+            for value in reversed(subset):
+                result = result * set_size + value
+            return result
 
         # Otherwise, convert to the equivalent binomial representation and fall-through encode
-        counts = {}
-        for value in subset:
-            counts[value] = counts[value] + 1 if value in counts else 1
-        subset = []
-        for i in range(set_size - 1):
-            last = -1 if len(subset) == 0 else subset[-1]
-            subset.append(last + 1 + (0 if i not in counts else counts[i]))
+        # Each binomial position is one past the previous position, plus the count
+        # of the corresponding item, with the positions starting from -1
+        counts = Counter(subset)
+        subset = [
+            position - 1
+            for position in accumulate(counts[i] + 1 for i in range(set_size - 1))
+        ]
         set_size += subset_size - 1
         subset_size = set_size - subset_size
 
@@ -78,15 +82,15 @@ def subset_to_subset_number(
     # If the order matters, shift-encode the items, reducing the problem to (n - 1, k -1)
     # at each iteration
     if order_matters:
-        result = subset[0]
-        subset = [x - 1 if x > result else x for x in subset[1:]]
-        factor = set_size - 1
-        while len(subset) > 0:
-            result *= factor
-            next = subset[0]
-            result += next
+        # The digit for each item is its rank amongst the items not yet selected,
+        # which is its value less the number of smaller items already selected
+        result = 0
+        factor = set_size
+        selected = []
+        for value in subset:
+            result = result * factor + value - bisect_left(selected, value)
+            insort(selected, value)
             factor -= 1
-            subset = [x - 1 if x > next else x for x in subset[1:]]
 
         return result
 
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, Optional, Dict, Any
 from weakref import WeakKeyDictionary
 
 ValueType = TypeVar("ValueType")
@@ -6,23 +6,57 @@ ValueType = TypeVar("ValueType")
 
 class InstanceProperty(Generic[ValueType]):
     """
-    A basic property which simply holds a value for each instance object. As
-    instances of classes which use this property are used as the key to a dictionary
-    holding the value, the instances must be hashable, and the hash must not rely on
-    the property for its hash calculation.
+    A basic property which simply holds a value for each instance object. The value
+    is stored in the instance's __dict__ where it has one (under a key private to the
+    property, so it appears in vars() but shouldn't be relied upon). Otherwise (e.g. for
+    classes using __slots__), the instance is used as the key to a dictionary holding the
+    value, so such instances must be hashable, and the hash must not rely on the property
+    for its hash calculation.
     """
     def __init__(self, default_value: ValueType = None):
         self._cache = WeakKeyDictionary()
         self._default: ValueType = default_value
 
+        # The key to store values under in instance dictionaries. This is unique to
+        # this property and fixed, so it doesn't depend on which classes own the property
+        self._key: str = f"_{InstanceProperty.__name__}_{id(self)}"
+
     def __get__(self, instance, owner) -> ValueType:
-        if instance in self._cache:
-            return self._cache[instance]
+        instance_dict = self._get_instance_dict(instance)
+        if instance_dict is not None:
+            return instance_dict.get(self._key, self._default)
+
+        try:
+            return self._cache.get(instance, self._default)
 
-        return self._default
+        # Objects which can't be weakly referenced (including None, for access
+        # via the owner class) can't have had a value set
+        except TypeError:
+            return self._default
 
     def __set__(self, instance, value: ValueType):
-        self._cache[instance] = value
+        instance_dict = self._get_instance_dict(instance)
+        if instance_dict is not None:
+            instance_dict[self._key] = value
+        else:
+            self._cache[instance] = value
 
     def __delete__(self, instance):
-        del self._cache[instance]
+        instance_dict = self._get_instance_dict(instance)
+        if instance_dict is not None:
+            del instance_dict[self._key]
+        else:
+            del self._cache[instance]
+
+    @staticmethod
+    def _get_instance_dict(instance) -> Optional[Dict[str, Any]]:
+        """
+        Gets the __dict__ of the given instance, if it has a writable one.
+
+        :param instance:    The instance.
+        :return:            The instance's __dict__, or None if it doesn't have one.
+        """
+        instance_dict = getattr(instance, "__dict__", None)
+
+        # Classes have a read-only mapping-proxy instead of a dict
+        return instance_dict if type(instance_dict) is dict else None
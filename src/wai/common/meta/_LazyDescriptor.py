@@ -1,4 +1,4 @@
-from typing import Callable, Any, List
+from typing import Callable, Any, List, Optional
 
 
 class LazyDescriptor:
@@ -14,6 +14,9 @@ class LazyDescriptor:
         self._names: List[str] = []
         self._owners: List = []
 
+        # The descriptor, once it has been created
+        self._descriptor: Optional[Any] = None
+
     def __get__(self, instance, owner):
         # Resolve and defer
         return self._resolve().__get__(instance, owner)
@@ -32,12 +35,18 @@ class LazyDescriptor:
         self._owners.append(owner)
 
     def _resolve(self):
-        # Create the actual descriptor
+        # Only create the actual descriptor once
+        if self._descriptor is not None:
+            return self._descriptor
         descriptor = self._descriptor_constructor()
+        self._descriptor = descriptor
 
         # If we're attached to anything, replace ourselves with the new descriptor
+        # (checking the owner's dict directly, as getattr would invoke our __get__)
         for name, owner in zip(self._names, self._owners):
-            if getattr(owner, name, None) is self:
+            if vars(owner).get(name, None) is self:
                 setattr(owner, name, descriptor)
+                if hasattr(descriptor, "__set_name__"):
+                    descriptor.__set_name__(owner, name)
 
         return descriptor
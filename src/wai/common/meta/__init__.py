@@ -13,5 +13,5 @@ from ._functions import (
 from ._import_code import get_import_code
 from ._instanceoptionalmethod import instanceoptionalmethod
 from ._InstanceProperty import InstanceProperty
-from ._metadata import with_metadata, get_metadata, has_metadata
+from ._metadata import with_metadata, get_metadata, get_metadata_or, has_metadata
 from ._non_default_kwargs import non_default_kwargs
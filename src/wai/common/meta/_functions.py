@@ -1,8 +1,14 @@
 import inspect
+import weakref
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 from .typing import AnyCallable
 
+# Cache of the class each function is defined in, found by get_class_from_function.
+# The classes are held weakly too, as each class holds its functions
+_function_classes: "weakref.WeakKeyDictionary[AnyCallable, weakref.ref]" = weakref.WeakKeyDictionary()
+
 
 def has_been_overridden(function, obj) -> bool:
     """
@@ -56,6 +62,15 @@ def get_class_from_function(function) -> Optional[type]:
     if not inspect.isfunction(function):
         return None
 
+    # Return the cached class if we've found it before. Failures aren't cached
+    # as the class may not be in the function's global dict yet (e.g. when called
+    # from within the class body)
+    class_ref = _function_classes.get(function, None)
+    if class_ref is not None:
+        cls = class_ref()
+        if cls is not None:
+            return cls
+
     # Get the dotted name of the function
     qual_name = function.__qualname__
 
@@ -80,6 +95,9 @@ def get_class_from_function(function) -> Optional[type]:
     if not inspect.isclass(cls):
         return None
 
+    # Cache the class for the function
+    _function_classes[function] = weakref.ref(cls)
+
     return cls
 
 
@@ -140,10 +158,52 @@ def all_as_kwargs(function: AnyCallable, *args, **kwargs) -> Dict[str, Any]:
                         Includes defaults.
     """
     # Get the function's signature
-    signature = inspect.signature(function)
+    signature = _get_signature(function)
 
     # Apply the given arguments and defaults
     binding: inspect.BoundArguments = signature.bind(*args, **kwargs)
     binding.apply_defaults()
 
     return dict(binding.arguments)
+
+
+# The kinds of parameter which a bound method's object is passed to
+_BINDABLE_PARAMETER_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+@lru_cache(maxsize=4096)
+def _cached_signature(function: AnyCallable) -> inspect.Signature:
+    """
+    Gets the signature of a function, caching the result as
+    inspecting it is expensive.
+
+    :param function:    The (hashable) function.
+    :return:            The function's signature.
+    """
+    return inspect.signature(function)
+
+
+def _get_signature(function: AnyCallable) -> inspect.Signature:
+    """
+    Gets the signature of a function, from the cache if possible.
+
+    :param function:    The function.
+    :return:            The function's signature.
+    """
+    # Caching bound methods would keep the objects they're bound to alive, so
+    # cache the underlying function's signature and drop its bound parameter
+    if inspect.ismethod(function):
+        signature = _get_signature(unbind(function))
+        parameters = tuple(signature.parameters.values())
+        if len(parameters) > 0 and parameters[0].kind in _BINDABLE_PARAMETER_KINDS:
+            return signature.replace(parameters=parameters[1:])
+
+        # Leave binding to other parameter kinds (e.g. *args) to inspect
+        return inspect.signature(function)
+
+    try:
+        return _cached_signature(function)
+
+    # Unhashable callables can't be cached
+    except TypeError:
+        return inspect.signature(function)
@@ -10,12 +10,14 @@ def get_import_code(cls: Type, indent: Union[int, str] = "", alias_inner_class:
     :param alias_inner_class:   Whether to add code to alias inner classes as outer classes.
     :return:                    The code.
     """
+    qualname = cls.__qualname__
+
     # Can't get import code for closure classes
-    if "<locals>" in cls.__qualname__:
-        raise ValueError(f"Can't get import code for closure class '{cls.__qualname__}'")
+    if "<locals>" in qualname:
+        raise ValueError(f"Can't get import code for closure class '{qualname}'")
 
     # Get the outer-most class to import
-    outer_class = cls.__qualname__[:cls.__qualname__.index(".")] if "." in cls.__qualname__ else cls.__qualname__
+    outer_class = qualname.partition(".")[0]
 
     # Format the indentation string
     if isinstance(indent, int):
@@ -26,6 +28,6 @@ def get_import_code(cls: Type, indent: Union[int, str] = "", alias_inner_class:
 
     # If it's an inner class, alias it
     if cls.__name__ != outer_class and alias_inner_class:
-        code += f"\n{indent}{cls.__name__} = {cls.__qualname__}"
+        code += f"\n{indent}{cls.__name__} = {qualname}"
 
     return code
@@ -15,14 +15,16 @@ def with_metadata(obj: T, key: str, value: Any) -> T:
     :return:        obj.
     """
     # Create the meta-data map
-    if not hasattr(obj, META_DATA_KEY):
+    metadata = getattr(obj, META_DATA_KEY, None)
+    if metadata is None:
+        metadata = {}
         try:
-            setattr(obj, META_DATA_KEY, {})
+            setattr(obj, META_DATA_KEY, metadata)
         except AttributeError as e:
             raise ValueError(f"Cannot set meta-data against objects of type {obj.__class__.__name__}") from e
 
     # Put this mapping in the map
-    getattr(obj, META_DATA_KEY)[key] = value
+    metadata[key] = value
 
     return obj
 
@@ -38,6 +40,20 @@ def get_metadata(obj: Any, key: str) -> Any:
     return getattr(obj, META_DATA_KEY)[key]
 
 
+def get_metadata_or(obj: Any, key: str, default: Any = None) -> Any:
+    """
+    Gets the meta-data from an object, or a default value if the
+    object has no meta-data associated with the given key.
+
+    :param obj:         The object to get meta-data from.
+    :param key:         The meta-data key to extract from.
+    :param default:     The value to return if there is no meta-data.
+    :return:            The value of the meta-data, or the default.
+    """
+    metadata = getattr(obj, META_DATA_KEY, None)
+    return default if metadata is None else metadata.get(key, default)
+
+
 def has_metadata(obj: Any, key: str) -> bool:
     """
     Checks if the given object has meta-data associated with
@@ -48,4 +64,5 @@ def has_metadata(obj: Any, key: str) -> bool:
     :return:        True if there is meta-data associated with the
                     given key, False if not.
     """
-    return hasattr(obj, META_DATA_KEY) and key in getattr(obj, META_DATA_KEY)
+    metadata = getattr(obj, META_DATA_KEY, None)
+    return metadata is not None and key in metadata
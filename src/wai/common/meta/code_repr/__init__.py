@@ -5,4 +5,4 @@ from ._CodeRepresentable import CodeRepresentable
 from ._error import CodeRepresentationError, IsNotCodeRepresentableValue, IsNotCodeRepresentableType, ConflictingImports
 from ._functional import code_repr, get_code_repr_function
 from ._typing import ImportDict, CodeRepresentation, CodeReprFunction
-from ._utilities import combine_import_dicts, from_init, get_code, get_import_dict
+from ._utilities import combine_import_dicts, merge_import_dict, from_init, get_code, get_import_dict
@@ -2,11 +2,51 @@
 Module for code_repr functions for builtin types.
 """
 from enum import Enum
-from typing import Tuple, Iterator, Callable, Any
+from typing import Iterable
+from weakref import WeakKeyDictionary
 
 from .._import_code import get_import_code
 from ._typing import CodeRepresentation
 
+# Functions from modules which import this one, bound by _resolve_circular_imports on first use
+_code_repr = None
+_merge_import_dict = None
+_get_import_dict = None
+_get_code = None
+
+# Cache of the import code for each type seen, as it only depends on the type. Held
+# weakly so that caching doesn't keep the types alive
+_import_codes: "WeakKeyDictionary[type, str]" = WeakKeyDictionary()
+
+
+def get_type_import_code(cls: type) -> str:
+    """
+    Gets the (cached) code to import a type for its code representation.
+
+    :param cls:     The type.
+    :return:        The import code.
+    """
+    if cls not in _import_codes:
+        _import_codes[cls] = get_import_code(cls, alias_inner_class=False)
+
+    return _import_codes[cls]
+
+
+def _resolve_circular_imports():
+    """
+    Binds the functions this module uses from modules which import it. This
+    can't happen at import time due to the circularity, and doing it once saves
+    re-importing on every call.
+    """
+    global _code_repr, _merge_import_dict, _get_import_dict, _get_code
+    from ._functional import code_repr
+    from ._utilities import merge_import_dict, get_import_dict, get_code
+
+    # Callers check _code_repr to see if this has happened, so bind it last,
+    # once the other functions are available
+    _merge_import_dict, _get_import_dict, _get_code = merge_import_dict, get_import_dict, get_code
+    _code_repr = code_repr
+
 
 def type_code_repr(cls: type) -> CodeRepresentation:
     """
@@ -15,10 +55,7 @@ def type_code_repr(cls: type) -> CodeRepresentation:
     :param cls:     The type to get the code representation for.
     :return:        The code representation of the type.
     """
-    # Get the import code for the class
-    import_code = get_import_code(cls, alias_inner_class=False)
-
-    return {cls.__qualname__: import_code}, cls.__qualname__
+    return {cls.__qualname__: get_type_import_code(cls)}, cls.__qualname__
 
 
 def primitive_code_repr(primitive) -> CodeRepresentation:
@@ -32,50 +69,34 @@ def primitive_code_repr(primitive) -> CodeRepresentation:
     return {}, repr(primitive)
 
 
-def container_code_repr(open_brace: str,
-                        close_brace: str,
-                        element_iterator: Iterator[Tuple],
-                        formatter: Callable[[Any], str]) -> CodeRepresentation:
+def flat_container_code_repr(open_brace: str,
+                             close_brace: str,
+                             elements: Iterable) -> CodeRepresentation:
     """
-    Base functionality for getting the code-representation
-    of one of the container types.
+    Gets the code-representation of a container whose elements are
+    represented singly (i.e. all but dictionaries).
 
     :param open_brace:                  The start of the code representation.
     :param close_brace:                 The end of the code representation.
-    :param element_iterator:            An iterator over tuples containing the elements of the container.
-    :param formatter:                   A formatter which formats the code of an element
-                                        into its container representation.
+    :param elements:                    The elements of the container.
     :return:                            The code representation of the container.
     :raises CodeRepresentationError:    If the container can't be represented.
     """
-    # Local imports to avoid circularity errors
-    from ._functional import code_repr
-    from ._utilities import combine_import_dicts, get_import_dict, get_code
+    # Import the functions we need from modules which import us
+    if _code_repr is None:
+        _resolve_circular_imports()
 
-    # Initialise the code representation with an open bracket and empty imports
+    # Represent each element in turn, collecting the imports
     import_dict = {}
-    code = open_brace
-
-    # Process each element in turn
-    first = True
-    for element in element_iterator:
-        # Get the code-representation for the element
-        element_reprs = tuple(map(code_repr, element))
-
-        # Add the element imports to our own
-        import_dict = combine_import_dicts(import_dict, *map(get_import_dict, element_reprs))
+    element_codes = []
+    for element in elements:
+        element_import_dict, element_code = _code_repr(element)
+        if len(element_import_dict) > 0:
+            _merge_import_dict(import_dict, element_import_dict)
+        element_codes.append(element_code)
 
-        # Insert a comma for every item after the first
-        if first:
-            first = False
-        else:
-            code += ", "
-
-        # Add the key-value pair representation
-        code += formatter(*map(get_code, element_reprs))
-
-    # Close out the braces
-    code += close_brace
+    # Join the elements with commas and surround with the braces
+    code = f"{open_brace}{', '.join(element_codes)}{close_brace}"
 
     return import_dict, code
 
@@ -87,10 +108,23 @@ def dict_code_repr(value: dict) -> CodeRepresentation:
     :param value:   The dictionary.
     :return:        The code-representation of the dictionary.
     """
-    return container_code_repr("{",
-                               "}",
-                               map(tuple, value.items()),
-                               lambda key, val: f"{key}: {val}")
+    # Import the functions we need from modules which import us
+    if _code_repr is None:
+        _resolve_circular_imports()
+
+    # Represent each key-value pair in turn, collecting the imports
+    import_dict = {}
+    item_codes = []
+    for key, val in value.items():
+        key_import_dict, key_code = _code_repr(key)
+        val_import_dict, val_code = _code_repr(val)
+        if len(key_import_dict) > 0:
+            _merge_import_dict(import_dict, key_import_dict)
+        if len(val_import_dict) > 0:
+            _merge_import_dict(import_dict, val_import_dict)
+        item_codes.append(f"{key_code}: {val_code}")
+
+    return import_dict, f"{{{', '.join(item_codes)}}}"
 
 
 def list_code_repr(value: list) -> CodeRepresentation:
@@ -100,10 +134,7 @@ def list_code_repr(value: list) -> CodeRepresentation:
     :param value:   The list.
     :return:        It's code representation.
     """
-    return container_code_repr("[",
-                               "]",
-                               ((el,) for el in value),
-                               lambda el: el)
+    return flat_container_code_repr("[", "]", value)
 
 
 def tuple_code_repr(value: tuple) -> CodeRepresentation:
@@ -113,10 +144,7 @@ def tuple_code_repr(value: tuple) -> CodeRepresentation:
     :param value:   The tuple.
     :return:        It's code representation.
     """
-    return container_code_repr("(",
-                               ")",
-                               ((el,) for el in value),
-                               lambda el: el)
+    return flat_container_code_repr("(", ")", value)
 
 
 def set_code_repr(value: set) -> CodeRepresentation:
@@ -126,10 +154,7 @@ def set_code_repr(value: set) -> CodeRepresentation:
     :param value:   The set.
     :return:        It's code representation.
     """
-    return container_code_repr("{",
-                               "}",
-                               ((el,) for el in value),
-                               lambda el: el)
+    return flat_container_code_repr("{", "}", value)
 
 
 def frozenset_code_repr(value: frozenset) -> CodeRepresentation:
@@ -139,10 +164,7 @@ def frozenset_code_repr(value: frozenset) -> CodeRepresentation:
     :param value:   The frozenset.
     :return:        It's code representation.
     """
-    return container_code_repr("frozenset({",
-                               "})",
-                               ((el,) for el in value),
-                               lambda el: el)
+    return flat_container_code_repr("frozenset({", "})", value)
 
 
 def enum_code_repr(value: Enum):
@@ -155,7 +177,4 @@ def enum_code_repr(value: Enum):
     # Get the enum type
     enum_type = type(value)
 
-    # Get the import code for the enumeration
-    import_code = get_import_code(enum_type, alias_inner_class=False)
-
-    return {enum_type.__qualname__: import_code}, f"{enum_type.__qualname__}.{value.name}"
+    return {enum_type.__qualname__: get_type_import_code(enum_type)}, f"{enum_type.__qualname__}.{value.name}"
@@ -3,13 +3,21 @@ Functional interface to code representations.
 """
 from enum import Enum
 from typing import Optional, Any
+from weakref import WeakKeyDictionary
 
 from ._builtins import type_code_repr, enum_code_repr
 from ._CodeRepresentable import CodeRepresentable
 from ._error import IsNotCodeRepresentableType, CodeRepresentationError, IsNotCodeRepresentableValue
-from ._honorary_members import get_honorary_code_repr_function
+from ._honorary_members import HONORARY_MEMBERS, get_honorary_code_repr_function
 from ._typing import CodeReprFunction, CodeRepresentation
 
+# The most common primitive types, which code_repr represents directly
+_PRIMITIVE_TYPES = frozenset((int, float, str, bool, type(None)))
+
+# Cache of the code_repr function (or None) for each non-honorary type seen by code_repr.
+# Held weakly so that caching doesn't keep (e.g. dynamically-created) types alive
+_code_repr_functions: "WeakKeyDictionary[type, Optional[CodeReprFunction]]" = WeakKeyDictionary()
+
 
 def get_code_repr_function(cls: type) -> Optional[CodeReprFunction]:
     """
@@ -49,12 +57,21 @@ def code_repr(obj: Any) -> CodeRepresentation:
     # Get the object's type
     cls = type(obj)
 
-    # Get the code_repr function
-    code_repr_function = get_code_repr_function(cls)
+    # Primitives are represented by their repr and need no imports
+    if cls in _PRIMITIVE_TYPES:
+        return {}, repr(obj)
 
-    # If it doesn't have a function, it's not code-representable
+    # Get the code_repr function, checking the honorary members directly first
+    # as they are the most common case
+    code_repr_function = HONORARY_MEMBERS.get(cls)
     if code_repr_function is None:
-        raise IsNotCodeRepresentableType(cls)
+        if cls not in _code_repr_functions:
+            _code_repr_functions[cls] = _get_cacheable_code_repr_function(cls)
+        code_repr_function = _code_repr_functions[cls]
+
+        # If it doesn't have a function, it's not code-representable
+        if code_repr_function is None:
+            raise IsNotCodeRepresentableType(cls)
 
     # Try to get the code-representation of the object
     try:
@@ -63,3 +80,29 @@ def code_repr(obj: Any) -> CodeRepresentation:
     # If it fails, the value is not code-representable
     except CodeRepresentationError as e:
         raise IsNotCodeRepresentableValue(obj) from e
+
+
+def _get_cacheable_code_repr_function(cls: type) -> Optional[CodeReprFunction]:
+    """
+    Gets the code_repr function for the given non-honorary type, in a form which
+    can be cached against the type. The code_repr method of CodeRepresentable
+    types is looked up on each call instead, so that the cache holds no reference
+    to the type, and reassigning the method takes effect.
+
+    :param cls:     The type to get the function for.
+    :return:        The code_repr function, or None if none available.
+    """
+    if issubclass(cls, CodeRepresentable):
+        return _code_representable_code_repr
+
+    return get_code_repr_function(cls)
+
+
+def _code_representable_code_repr(obj: CodeRepresentable) -> CodeRepresentation:
+    """
+    The code_repr function for instances of CodeRepresentable types.
+
+    :param obj:     The object to get the code representation for.
+    :return:        The code representation of the object.
+    """
+    return type(obj).code_repr(obj)
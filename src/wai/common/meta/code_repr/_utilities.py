@@ -2,11 +2,17 @@
 Utility functions for working with code representations.
 """
 from inspect import signature, Signature, Parameter
+from typing import Dict, Any, Callable, List
+from weakref import WeakKeyDictionary
 
 from ._error import ConflictingImports
 from ._functional import code_repr
 from ._typing import CodeRepresentation, ImportDict
 
+# Cache of the generated function which implements from_init for each type. Held
+# weakly so that caching doesn't keep the types (or their default values) alive
+_from_init_functions: "WeakKeyDictionary[type, Callable[[Dict[str, Any]], CodeRepresentation]]" = WeakKeyDictionary()
+
 
 def get_import_dict(code_representation: CodeRepresentation) -> ImportDict:
     """
@@ -41,16 +47,27 @@ def combine_import_dicts(*import_dicts: ImportDict) -> ImportDict:
     result = {}
 
     for import_dict in import_dicts:
-        for imported_name, import_code in import_dict.items():
-            if imported_name in result:
-                if import_code != result[imported_name]:
-                    raise ConflictingImports(imported_name, import_code, result[imported_name])
-            else:
-                result[imported_name] = import_code
+        merge_import_dict(result, import_dict)
 
     return result
 
 
+def merge_import_dict(into: ImportDict, import_dict: ImportDict):
+    """
+    Merges an import dictionary into another in-place, ensuring no
+    imported names are lost.
+
+    :param into:                    The import dictionary to merge into.
+    :param import_dict:             The import dictionary to merge.
+    :raises ConflictingImports:     If there are conflicting imports between
+                                    the import dictionaries.
+    """
+    for imported_name, import_code in import_dict.items():
+        existing_import_code = into.setdefault(imported_name, import_code)
+        if import_code != existing_import_code:
+            raise ConflictingImports(imported_name, import_code, existing_import_code)
+
+
 def from_init(self, locals_) -> CodeRepresentation:
     """
     Utility for when the code-representation is completely
@@ -64,45 +81,80 @@ def from_init(self, locals_) -> CodeRepresentation:
     # Get the type being initialised
     cls = type(self)
 
-    # Initialise the import dict with the import for the class itself
-    import_dict = get_import_dict(code_repr(cls))
-
-    # Get the method signature of the __init__ method
-    init_signature: Signature = signature(self.__init__)
-
-    # Start the representation
-    code = f"{cls.__qualname__}("
-
-    # Format each argument in turn
-    first = True
-    for name, parameter in init_signature.parameters.items():
-        parameter_string = ""
-        value = locals_[name]
-        if parameter.kind in {Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY}:
-            if value is not parameter.default:
-                value_repr = code_repr(value)
-                import_dict = combine_import_dicts(import_dict, get_import_dict(value_repr))
-                parameter_string = (f"{name}={get_code(value_repr)}"
-                                    if parameter.kind == Parameter.KEYWORD_ONLY
-                                    else get_code(value_repr))
-        elif parameter.kind == Parameter.VAR_POSITIONAL:
-            if len(value) > 0:
-                value_reprs = tuple(map(code_repr, value))
-                import_dict = combine_import_dicts(import_dict, *map(get_import_dict, value_reprs))
-                parameter_string = ", ".join(map(get_code, value_reprs))
-        elif parameter.kind == Parameter.VAR_KEYWORD:
-            if len(value) > 0:
-                value_reprs = {key: code_repr(value) for key, value in value.items()}
-                import_dict = combine_import_dicts(import_dict, *map(get_import_dict, value_reprs.values()))
-                parameter_string = ", ".join(f"{key}={get_code(value_repr)}" for key, value_repr in value_reprs.items())
-
-        if parameter_string != "":
-            if not first:
-                code += ", "
-            else:
-                first = False
-            code += parameter_string
+    # Generate the implementation for the type on first use, as its
+    # signature (and therefore the code to run) is fixed
+    if cls not in _from_init_functions:
+        _from_init_functions[cls] = _generate_from_init_function(cls, signature(self.__init__))
+
+    return _from_init_functions[cls](locals_)
 
-    code += ")"
 
-    return import_dict, code
+def _generate_from_init_function(cls: type, init_signature: Signature) -> Callable[[Dict[str, Any]], CodeRepresentation]:
+    """
+    Generates a function which performs from_init for the given type,
+    with the handling of each parameter to the type's __init__ method
+    unrolled into straight-line code.
+
+    :param cls:             The type.
+    :param init_signature:  The signature of the type's (bound) __init__ method.
+    :return:                A function from the __init__ method's locals to the
+                            code-representation of the object.
+    """
+    # The scope the generated code executes in
+    class_import_dict, _ = code_repr(cls)
+    scope = {
+        "code_repr": code_repr,
+        "merge_import_dict": merge_import_dict,
+        "class_import_dict": class_import_dict
+    }
+
+    # Generate the handling code for each parameter in turn
+    lines: List[str] = [
+        "def from_init_function(locals_):",
+        "    import_dict = dict(class_import_dict)",
+        "    parameter_strings = []"
+    ]
+    for index, (name, parameter) in enumerate(init_signature.parameters.items()):
+        lines.append(f"    value = locals_[{name!r}]")
+
+        # Var-args add each element as its own parameter string
+        if parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            if parameter.kind is Parameter.VAR_POSITIONAL:
+                lines.append("    for element in value:")
+                element_code = "element_code"
+            else:
+                lines.append("    for key, element in value.items():")
+                element_code = 'f"{key}={element_code}"'
+            lines += [
+                "        element_import_dict, element_code = code_repr(element)",
+                "        if len(element_import_dict) > 0:",
+                "            merge_import_dict(import_dict, element_import_dict)",
+                f"        parameter_strings.append({element_code})"
+            ]
+            continue
+
+        # Single arguments are skipped if they are the default value (parameters without
+        # a default never are, as no argument can be the 'empty' marker)
+        indent = "    "
+        if parameter.default is not Parameter.empty:
+            default_name = f"default_{index}"
+            scope[default_name] = parameter.default
+            lines.append(f"    if value is not {default_name}:")
+            indent += "    "
+        value_code = (f'f"{name}={{value_code}}"'
+                      if parameter.kind is Parameter.KEYWORD_ONLY
+                      else "value_code")
+        lines += [
+            f"{indent}value_import_dict, value_code = code_repr(value)",
+            f"{indent}if len(value_import_dict) > 0:",
+            f"{indent}    merge_import_dict(import_dict, value_import_dict)",
+            f"{indent}parameter_strings.append({value_code})"
+        ]
+
+    # Join the parameters into the call to the type
+    lines.append(f"    return import_dict, {cls.__qualname__ + '('!r} + ', '.join(parameter_strings) + ')'")
+
+    # Execute the function definition code
+    exec("\n".join(lines), scope)
+
+    return scope["from_init_function"]
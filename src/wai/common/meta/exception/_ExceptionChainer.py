@@ -10,6 +10,7 @@ class ExceptionChainer:
     def __init__(self, *exc_types: Type[Exception]):
         self.__types: Tuple[Type[Exception]] = tuple()
         self.__exceptions: List[Optional[Exception]] = []
+        self.__exception_count: int = 0
 
         self.set_types(*exc_types)
 
@@ -17,7 +18,7 @@ class ExceptionChainer:
         """
         Gets the number of exceptions captured.
         """
-        return sum(1 for e in self.__exceptions if e is not None)
+        return self.__exception_count
 
     def no_exception_count(self) -> int:
         """
@@ -30,6 +31,7 @@ class ExceptionChainer:
         Clears the list of captured exceptions.
         """
         self.__exceptions.clear()
+        self.__exception_count = 0
 
     def set_types(self, *exc_types: Type[Exception]):
         """
@@ -81,16 +83,14 @@ class ExceptionChainer:
         if reversed:
             exceptions.reverse()
 
-        # Chain the exceptions
-        exception = exceptions[0]
-        for i in range(1, len(exceptions)):
-            try:
-                raise exceptions[i] from exception
-            except Exception as e:
-                exception = e
+        # Chain the exceptions (as 'raise ... from ...' would, but without
+        # raising and catching each one)
+        for cause, exception in zip(exceptions, exceptions[1:]):
+            exception.__cause__ = cause
+            exception.__suppress_context__ = True
 
         # Raise the chained exception
-        raise exception
+        raise exceptions[-1]
 
     def __enter__(self):
         return self
@@ -103,6 +103,8 @@ class ExceptionChainer:
         elif issubclass(exc_type, self.__types):
             # An exception we are looking for occurred
             self.__exceptions.append(exc_val)
+            if exc_val is not None:
+                self.__exception_count += 1
             return True
         else:
             # An unexpected exception occurred, so don't suppress it
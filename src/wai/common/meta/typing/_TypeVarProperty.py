@@ -8,17 +8,23 @@ class TypeVarProperty:
     Property class which caches the dynamic type of a type-variable
     for a class.
     """
+    __slots__ = ("_typevar", "_base_class", "_cache")
+
     def __init__(self, typevar: TypeVar):
         self._typevar: TypeVar = typevar
         self._base_class = None
         self._cache = {}
 
     def __get__(self, instance, owner):
-        # Get the typevar argument if it's not cached
-        if owner not in self._cache:
-            self._cache[owner] = get_argument_to_typevar(owner, self._base_class, self._typevar)
+        # Return the cached typevar argument if we have it
+        try:
+            return self._cache[owner]
 
-        return self._cache[owner]
+        # Otherwise get and cache it
+        except KeyError:
+            argument = get_argument_to_typevar(owner, self._base_class, self._typevar)
+            self._cache[owner] = argument
+            return argument
 
     def __set_name__(self, owner, name):
         # Prevents reassignment to parameterised generic base class
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Type, TypeVar
 
 import typing_inspect
@@ -5,6 +6,7 @@ import typing_inspect
 from ._get_argument_to_typevar_base import check_args
 
 
+@lru_cache(maxsize=None)
 def get_argument_to_typevar(cls: Type, generic_base_class: Type, typevar: TypeVar):
     """
     Gets the argument given to a type variable parameterising
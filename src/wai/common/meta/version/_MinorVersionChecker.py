@@ -0,0 +1,19 @@
+from typing import Optional
+
+from ._PythonVersionChecker import PythonVersionChecker
+
+
+class MinorVersionChecker(PythonVersionChecker):
+    """
+    Checks if the version of Python is somewhere in a given major.minor version.
+    """
+    __slots__ = ("_major_minor", "_error")
+
+    def __init__(self, major: int, minor: int):
+        self._major_minor = (major, minor)
+        self._error = f"Not Python {major}.{minor}"
+
+    def check(self, major: int, minor: int, micro: int, releaselevel: str, serial: int) -> Optional[str]:
+        if (major, minor) == self._major_minor:
+            return None
+        return self._error
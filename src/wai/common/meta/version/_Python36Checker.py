@@ -1,13 +1,11 @@
-from typing import Optional
+from ._MinorVersionChecker import MinorVersionChecker
 
-from ._PythonVersionChecker import PythonVersionChecker
 
-
-class Python36Checker(PythonVersionChecker):
+class Python36Checker(MinorVersionChecker):
     """
     Checks if the version of Python is somewhere in 3.6.
     """
-    def check(self, major: int, minor: int, micro: int, releaselevel: str, serial: int) -> Optional[str]:
-        if major == 3 and minor == 6:
-            return None
-        return "Not Python 3.6"
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(3, 6)
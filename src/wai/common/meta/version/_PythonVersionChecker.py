@@ -7,6 +7,8 @@ class PythonVersionChecker(ABC):
     """
     Interface for classes which check if the Python version matches a certain criteria.
     """
+    __slots__ = ("_current_check_result",)
+
     @abstractmethod
     def check(self, major: int, minor: int, micro: int, releaselevel: str, serial: int) -> Optional[str]:
         """
@@ -28,15 +30,23 @@ class PythonVersionChecker(ABC):
 
         :return:    None for pass and error-string for fail.
         """
+        # The current Python version can't change, so only run the check once
+        try:
+            return self._current_check_result
+        except AttributeError:
+            pass
+
         # Get the current Python version
         version = sys.version_info
 
         # Run the check
-        return self.check(version.major,
-                          version.minor,
-                          version.micro,
-                          version.releaselevel,
-                          version.serial)
+        self._current_check_result = self.check(version.major,
+                                                version.minor,
+                                                version.micro,
+                                                version.releaselevel,
+                                                version.serial)
+
+        return self._current_check_result
 
     def ensure_current(self):
         """
@@ -9,6 +9,8 @@ class SupportedVersionChecker(PythonVersionChecker):
     """
     Checks if the version of Python is supported by this library.
     """
+    __slots__ = ()
+
     supported_versions: Dict[str, PythonVersionChecker] = {
         "Python 3.6": Python36Checker(),
         "Python 3.7": Python37Checker()
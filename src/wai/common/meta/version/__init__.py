@@ -1,6 +1,7 @@
 """
 Package for working with Python versions.
 """
+from ._MinorVersionChecker import MinorVersionChecker
 from ._Python36Checker import Python36Checker
 from ._Python37Checker import Python37Checker
 from ._PythonVersionChecker import PythonVersionChecker, PythonVersionError
@@ -1,8 +1,13 @@
+from itertools import accumulate
+
+
 class Encoding:
     """
     Class representing the one-hot encoding for a single set of strings.
     Typically represents one (source) column in a dataset.
     """
+    __slots__ = ("__numeric_type", "__lookup", "__reverse_lookup", "__encodings", "__zero", "__one")
+
     def __init__(self, strings, numeric_type=int):
         # Set the numeric type
         self.__numeric_type = numeric_type
@@ -27,6 +32,10 @@ class Encoding:
         """
         self.__encodings = [None] * self.size()
 
+        # Create the zero and one values of the numeric type once for all encodings
+        self.__zero = self.__numeric_type(0)
+        self.__one = self.__numeric_type(1)
+
     def set_numeric_type(self, numeric_type):
         """
         Sets the numeric type to use for encoded values.
@@ -45,12 +54,8 @@ class Encoding:
         :return:        The encoded index of the string.
         """
 
-        # If the string is not encoded, return None
-        if string not in self.__lookup:
-            return None
-
-        # Return the encoded index
-        return self.__lookup[string]
+        # Return the encoded index, or None if the string is not encoded
+        return self.__lookup.get(string, None)
 
     def get_string(self, index):
         """
@@ -78,11 +83,14 @@ class Encoding:
             return None
 
         # If the encodings cache doesn't have an entry for this string, create it
-        if self.__encodings[index] is None:
-            self.__encodings[index] = create_encoded_array(index, self.size(), self.__numeric_type)
+        encoding = self.__encodings[index]
+        if encoding is None:
+            encoding = [self.__zero] * self.size()
+            encoding[index] = self.__one
+            self.__encodings[index] = encoding
 
         # Return the encoding
-        return self.__encodings[index]
+        return encoding
 
     def encode_column(self, column):
         """
@@ -91,7 +99,7 @@ class Encoding:
         :param column:  The list of strings to encode.
         :return:        A list of encodings.
         """
-        return [self.get_encoding(string) for string in column]
+        return list(map(self.get_encoding, column))
 
     def get_header_names(self, prefix):
         """
@@ -121,6 +129,8 @@ class Mapping:
     dataset. The entry for a particular column may be None, indicating that it
     should not be encoded.
     """
+    __slots__ = ("__mapping",)
+
     def __init__(self, num_columns):
         # Create the empty collection of encodings
         self.__mapping = [None] * num_columns
@@ -166,9 +176,8 @@ class Mapping:
 
         # Create an accumulated list of encoded column lengths
         cumulative_lengths = [0]
-        for i in range(0, len(self)):
-            length = 1 if self.__mapping[i] is None else len(self.__mapping[i])
-            cumulative_lengths.append(cumulative_lengths[i] + length)
+        cumulative_lengths.extend(accumulate(1 if encoding is None else len(encoding)
+                                             for encoding in self.__mapping))
 
         # Initialise the output
         output = []
@@ -176,8 +185,7 @@ class Mapping:
         # For each selected index, add all of the indices between the accumulated
         # lengths (i.e. the range of encoded indices)
         for index in selection:
-            for i in range(cumulative_lengths[index], cumulative_lengths[index + 1]):
-                output.append(i)
+            output.extend(range(cumulative_lengths[index], cumulative_lengths[index + 1]))
 
         # Return the result
         return output
@@ -205,21 +213,22 @@ class Mapping:
         :return:        Nothing, the row is encoded in place.
         """
 
-        # Process the row from last to first (to preserve indices after insertion)
-        for i in reversed(range(len(row))):
-            # Can skip non-encoded values
-            if self.__mapping[i] is None:
-                continue
+        # Build the encoded row in a single forward pass, rather than popping
+        # and inserting in place (which shifts the tail of the row each time)
+        encoded_row = []
+        for i, value in enumerate(row):
+            encoding = self.__mapping[i]
 
-            # Remove the string value
-            value = row.pop(i)
+            # Non-encoded values are kept as-is
+            if encoding is None:
+                encoded_row.append(value)
 
-            # Get the encoding from the map
-            encoded_value = self.__mapping[i].get_encoding(value)
+            # Otherwise add the encoding of the value
+            else:
+                encoded_row.extend(encoding.get_encoding(value))
 
-            # Insert the encoding into the data
-            for j in reversed(range(len(encoded_value))):
-                row.insert(i, encoded_value[j])
+        # Replace the row's contents with the encoded values
+        row[:] = encoded_row
 
     def __len__(self):
         return len(self.__mapping)
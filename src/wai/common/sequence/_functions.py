@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from typing import Iterable, Union, Sequence, TypeVar
 
 SequenceType = TypeVar("SequenceType", bound=Sequence)
@@ -46,9 +47,9 @@ def extract_by_index(sequence: SequenceType, indices: Iterable[int]) -> Sequence
     :param indices:     The indices of the elements to get.
     :return:            The selected elements.
     """
-    # Use extracting iterator to initialise a new sequence of the same type
-    from ..iterate import extract_by_index
-    return type(sequence)(extract_by_index(sequence, indices))
+    # Gather the elements with a list comprehension (rather than resuming a generator
+    # for each element) to initialise a new sequence of the same type
+    return type(sequence)([sequence[index] for index in indices])
 
 
 def binary_search(sequence: Sequence[int], target: int) -> int:
@@ -61,13 +62,5 @@ def binary_search(sequence: Sequence[int], target: int) -> int:
     :param target:      The target value to find.
     :return:            The index of the found element.
     """
-    start = 0
-    end = len(sequence)
-    while end != start:
-        pivot = (start + end) // 2
-        if sequence[pivot] >= target:
-            end = pivot
-        else:
-            start = pivot + 1
-
-    return start
+    # This is exactly the left-most insertion point, which bisect finds natively
+    return bisect_left(sequence, target)
@@ -1,7 +1,7 @@
 import os
 from abc import abstractmethod
 from io import BytesIO
-from typing import Generic, TypeVar, IO
+from typing import Generic, TypeVar, IO, Sequence, List
 
 # The type of object the serialiser serialises/deserialises
 ObjectType = TypeVar("ObjectType")
@@ -12,6 +12,8 @@ class Serialiser(Generic[ObjectType]):
     Base class for objects which serialise other objects
     to/from a binary representation.
     """
+    __slots__ = ()
+
     # ============= #
     # Serialisation #
     # ============= #
@@ -45,6 +47,17 @@ class Serialiser(Generic[ObjectType]):
         self._check(obj)
         self._serialise(obj, stream)
 
+    def serialise_sequence(self, objs: Sequence[ObjectType], stream: IO[bytes]):
+        """
+        Serialises each of the given objects to the given data-stream in turn.
+        Serialisers of fixed-size objects can override this to write them in bulk.
+
+        :param objs:        The objects to serialise.
+        :param stream:      The stream to write the objects to.
+        """
+        for obj in objs:
+            self.serialise(obj, stream)
+
     def serialise_to_file(self, obj: ObjectType, filename: str):
         """
         Serialises the object to a file.
@@ -102,6 +115,18 @@ class Serialiser(Generic[ObjectType]):
         """
         return self._deserialise(stream)
 
+    def deserialise_sequence(self, stream: IO[bytes], count: int) -> List[ObjectType]:
+        """
+        Deserialises a number of consecutively-serialised objects from the given
+        data-stream. Serialisers of fixed-size objects can override this to read
+        them in bulk.
+
+        :param stream:  The stream to read the objects from.
+        :param count:   The number of objects to read.
+        :return:        The deserialised objects, in serialised order.
+        """
+        return [self.deserialise(stream) for _ in range(count)]
+
     def deserialise_from_file(self, filename: str) -> ObjectType:
         """
         Deserialises an object from the given file.
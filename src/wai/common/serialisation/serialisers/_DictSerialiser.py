@@ -11,14 +11,14 @@ class DictSerialiser(
     Serialiser[Dict[KeyType, ValueType]],
     Generic[KeyType, ValueType]
 ):
+    __slots__ = ("_key_serialiser", "_value_serialiser", "_length_serialiser")
+
     def __init__(
             self,
             key_serialiser: Serialiser[KeyType],
             value_serialiser: Serialiser[ValueType],
             length_serialiser: Serialiser[int] = IntSerialiser(signed=False),
     ):
-        super().__init__()
-
         self._key_serialiser: Serialiser[KeyType] = key_serialiser
         self._value_serialiser: Serialiser[ValueType] = value_serialiser
         self._length_serialiser: Serialiser[int] = length_serialiser
@@ -29,7 +29,7 @@ class DictSerialiser(
     ):
         # Must be a dictionary
         if not isinstance(obj, dict):
-            raise ValueError(f"{DictSerialiser.__class__.__name__} serialises dictionaries")
+            raise ValueError(f"{DictSerialiser.__name__} serialises dictionaries")
 
     def _serialise(
             self,
@@ -43,21 +43,21 @@ class DictSerialiser(
         )
 
         # Serialise each key/value pair in turn
+        serialise_key = self._key_serialiser.serialise
+        serialise_value = self._value_serialiser.serialise
         for key, value in obj.items():
-            self._key_serialiser.serialise(key, stream)
-            self._value_serialiser.serialise(value, stream)
+            serialise_key(key, stream)
+            serialise_value(value, stream)
 
     def _deserialise(
             self,
             stream: IO[bytes]
     ) -> Dict[KeyType, ValueType]:
-        # Create a dict to accumulate the key/value pairs as they are deserialised
-        result = {}
-
-        # Deserialise the keys and values
-        for _ in range(self._length_serialiser.deserialise(stream)):
-            key = self._key_serialiser.deserialise(stream)
-            value = self._value_serialiser.deserialise(stream)
-            result[key] = value
-
-        return result
+        # Deserialise the keys and values (as pairs rather than via a dict comprehension,
+        # which evaluates the value before the key prior to Python 3.8)
+        deserialise_key = self._key_serialiser.deserialise
+        deserialise_value = self._value_serialiser.deserialise
+        return dict(
+            (deserialise_key(stream), deserialise_value(stream))
+            for _ in range(self._length_serialiser.deserialise(stream))
+        )
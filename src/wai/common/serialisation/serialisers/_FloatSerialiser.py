@@ -1,5 +1,6 @@
 import struct
-from typing import IO
+from io import BytesIO
+from typing import IO, Sequence, List
 
 from .._Serialiser import Serialiser
 
@@ -8,7 +9,9 @@ class FloatSerialiser(Serialiser[float]):
     def __init__(self,
                  little_endian: bool = True,
                  double_precision: bool = True):
-        self._format = f"{'<' if little_endian else '>'}{'d' if double_precision else 'f'}"
+        self._byte_order: str = '<' if little_endian else '>'
+        self._type_code: str = 'd' if double_precision else 'f'
+        self._format = f"{self._byte_order}{self._type_code}"
         self._num_bytes: int = 8 if double_precision else 4
 
     def _check(self, obj: float):
@@ -21,3 +24,32 @@ class FloatSerialiser(Serialiser[float]):
 
     def _deserialise(self, stream: IO[bytes]) -> float:
         return struct.unpack(self._format, stream.read(self._num_bytes))[0]
+
+    def serialise_sequence(self, objs: Sequence[float], stream: IO[bytes]):
+        # Sub-types which change how values are written must serialise them one at a time
+        cls = type(self)
+        if cls.serialise is not FloatSerialiser.serialise or cls._serialise is not FloatSerialiser._serialise:
+            return super().serialise_sequence(objs, stream)
+
+        # Check all values before packing them with a single call
+        for obj in objs:
+            self._check(obj)
+
+        stream.write(struct.pack(f"{self._byte_order}{len(objs)}{self._type_code}", *objs))
+
+    def deserialise_sequence(self, stream: IO[bytes], count: int) -> List[float]:
+        # Sub-types which change how values are read must deserialise them one at a time
+        cls = type(self)
+        if cls.deserialise is not FloatSerialiser.deserialise or cls._deserialise is not FloatSerialiser._deserialise:
+            return super().deserialise_sequence(stream, count)
+
+        # Read all values at once
+        bytes_ = stream.read(count * self._num_bytes)
+
+        # If the stream ended early, read what there is one value at a time,
+        # so the error is the same as for a single value
+        if len(bytes_) < count * self._num_bytes:
+            return super().deserialise_sequence(BytesIO(bytes_), count)
+
+        # Unpack the values with a single call
+        return list(struct.unpack(f"{self._byte_order}{count}{self._type_code}", bytes_))
@@ -1,7 +1,12 @@
-from typing import IO
+import struct
+from io import BytesIO
+from typing import IO, Optional, Sequence, List
 
 from .._Serialiser import Serialiser
 
+# The struct type-codes for the (signed) integer sizes that struct supports natively
+STRUCT_TYPE_CODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+
 
 class IntSerialiser(Serialiser[int]):
     def __init__(self,
@@ -16,6 +21,12 @@ class IntSerialiser(Serialiser[int]):
         self._num_bytes: int = num_bytes
         self._signed: bool = signed
 
+        # The struct byte-order and type-code for bulk serialisation, if the size is supported
+        self._struct_byte_order: str = "<" if little_endian else ">"
+        self._struct_type_code: Optional[str] = STRUCT_TYPE_CODES.get(num_bytes, None)
+        if self._struct_type_code is not None and not signed:
+            self._struct_type_code = self._struct_type_code.upper()
+
     def _check(self, obj: int):
         # Make sure the value really is an int
         if not isinstance(obj, int):
@@ -60,3 +71,44 @@ class IntSerialiser(Serialiser[int]):
     def _deserialise(self, stream: IO[bytes]) -> int:
         bytes_ = stream.read(self._num_bytes)
         return int.from_bytes(bytes_, self._endianness, signed=self._signed)
+
+    def serialise_sequence(self, objs: Sequence[int], stream: IO[bytes]):
+        # Sub-types which change how values are written must serialise them one at a time
+        cls = type(self)
+        if cls.serialise is not IntSerialiser.serialise or cls._serialise is not IntSerialiser._serialise:
+            return super().serialise_sequence(objs, stream)
+
+        # Check all values before converting them all at once
+        for obj in objs:
+            self._check(obj)
+
+        # Pack natively-supported sizes with a single call
+        if self._struct_type_code is not None:
+            stream.write(struct.pack(f"{self._struct_byte_order}{len(objs)}{self._struct_type_code}", *objs))
+        else:
+            stream.write(b"".join(obj.to_bytes(self._num_bytes, self._endianness, signed=self._signed)
+                                  for obj in objs))
+
+    def deserialise_sequence(self, stream: IO[bytes], count: int) -> List[int]:
+        # Sub-types which change how values are read must deserialise them one at a time
+        cls = type(self)
+        if cls.deserialise is not IntSerialiser.deserialise or cls._deserialise is not IntSerialiser._deserialise:
+            return super().deserialise_sequence(stream, count)
+
+        # Read all values at once
+        num_bytes = self._num_bytes
+        bytes_ = stream.read(count * num_bytes)
+
+        # If the stream ended early, read what there is one value at a time,
+        # so the result (or error) is the same as for a single value
+        if len(bytes_) < count * num_bytes:
+            return super().deserialise_sequence(BytesIO(bytes_), count)
+
+        # Unpack natively-supported sizes with a single call
+        if self._struct_type_code is not None:
+            return list(struct.unpack(f"{self._struct_byte_order}{count}{self._struct_type_code}", bytes_))
+
+        return [
+            int.from_bytes(bytes_[offset:offset + num_bytes], self._endianness, signed=self._signed)
+            for offset in range(0, count * num_bytes, num_bytes)
+        ]
@@ -9,11 +9,12 @@ class LengthPrefixedBytesSerialiser(Serialiser[bytes]):
     Serialiser which serialises raw binary data. Inserts the length of
     the data in bytes before the raw binary data.
     """
+    __slots__ = ("_length_serialiser",)
+
     def __init__(
             self,
             length_serialiser: Serialiser[int] = IntSerialiser(signed=False)
     ):
-        super().__init__()
         self._length_serialiser: Serialiser[int] = length_serialiser
 
     def _check(self, obj: bytes):
@@ -32,3 +33,34 @@ class LengthPrefixedBytesSerialiser(Serialiser[bytes]):
         byte_length: int = self._length_serialiser.deserialise(stream)
 
         return stream.read(byte_length)
+
+    def deserialise_into(self, stream: IO[bytes], buffer: bytearray) -> memoryview:
+        """
+        Deserialises binary data from the given data-stream into the given
+        buffer, rather than into a newly-allocated bytes object. The buffer
+        is grown if it is too small to hold the data, so can be reused
+        across calls (views returned by previous calls must be released
+        before the buffer can grow).
+
+        :param stream:  The stream to read the data from.
+        :param buffer:  The buffer to read the data into.
+        :return:        A view of the data in the buffer.
+        """
+        # Read the length from the stream
+        byte_length: int = self._length_serialiser.deserialise(stream)
+
+        # Make sure the buffer is big enough
+        if len(buffer) < byte_length:
+            buffer.extend(bytes(byte_length - len(buffer)))
+
+        # Read the data directly into the buffer (streams may return less than
+        # requested per call, so keep reading until full or out of data)
+        view = memoryview(buffer)[:byte_length]
+        bytes_read = 0
+        while bytes_read < byte_length:
+            num_read = stream.readinto(view[bytes_read:])
+            if not num_read:
+                break
+            bytes_read += num_read
+
+        return view[:bytes_read]
@@ -10,13 +10,13 @@ class ListSerialiser(
     Serialiser[List[ElementType]],
     Generic[ElementType]
 ):
+    __slots__ = ("_element_serialiser", "_length_serialiser")
+
     def __init__(
             self,
             element_serialiser: Serialiser[ElementType],
             length_serialiser: Serialiser[int] = IntSerialiser(signed=False)
     ):
-        super().__init__()
-
         self._element_serialiser = element_serialiser
         self._length_serialiser = length_serialiser
 
@@ -26,7 +26,7 @@ class ListSerialiser(
     ):
         # Must be a list
         if not isinstance(obj, list):
-            raise ValueError(f"{ListSerialiser.__class__.__name__} serialises lists")
+            raise ValueError(f"{ListSerialiser.__name__} serialises lists")
 
     def _serialise(
             self,
@@ -36,9 +36,8 @@ class ListSerialiser(
         # Serialise the length of the list
         self._length_serialiser.serialise(len(obj), stream)
 
-        # Serialise each value in turn
-        for value in obj:
-            self._element_serialiser.serialise(value, stream)
+        # Serialise the values in order
+        self._element_serialiser.serialise_sequence(obj, stream)
 
     def _deserialise(
             self,
@@ -48,7 +47,4 @@ class ListSerialiser(
         length = self._length_serialiser.deserialise(stream)
 
         # Deserialise 'length' number of elements in serialised order
-        return [
-            self._element_serialiser.deserialise(stream)
-            for _index in range(length)
-        ]
+        return self._element_serialiser.deserialise_sequence(stream, length)
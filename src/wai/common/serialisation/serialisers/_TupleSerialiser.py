@@ -1,52 +1,149 @@
-from typing import Generic, TypeVar, IO
+from io import BytesIO
+from typing import Generic, TypeVar, IO, Callable, Tuple, List
 
 from .._Serialiser import Serialiser
 
 TupleType = TypeVar("TupleType", bound=tuple)
 
+# The most elements for which specialised (de)serialisation code is generated. Larger
+# tuples use generic loops instead, to keep the generated code to a reasonable size
+_MAX_GENERATED_ELEMENTS: int = 16
+
 
 class TupleSerialiser(
     Serialiser[TupleType],
     Generic[TupleType]
 ):
+    __slots__ = ("_element_serialisers", "_num_elements", "_buffered", "_serialise_elements", "_deserialise_elements")
+
     def __init__(
             self,
-            *element_serialisers: Serialiser  # Should be a serialiser matching each element of TupleType,
-                                              # but this is not supported yet
+            *element_serialisers: Serialiser,  # Should be a serialiser matching each element of TupleType,
+                                               # but this is not supported yet
+            buffered: bool = False  # Whether to serialise the elements to memory first, and write
+                                    # them to the stream in one go (e.g. for unbuffered streams)
     ):
-        super().__init__()
+        self._set_schema(element_serialisers, buffered)
+
+    def __getstate__(self):
+        # The generated element functions can't be pickled (and would be bound to the
+        # original element-serialisers when copied), so only the schema is kept, along
+        # with the attributes of any sub-type
+        return self._element_serialisers, self._buffered, getattr(self, "__dict__", None)
 
+    def __setstate__(self, state):
+        # Restore the schema directly, as sub-types' __init__ may take other arguments
+        element_serialisers, buffered, instance_dict = state
+        self._set_schema(element_serialisers, buffered)
+        if instance_dict is not None:
+            self.__dict__.update(instance_dict)
+
+    def _set_schema(
+            self,
+            element_serialisers: Tuple[Serialiser, ...],
+            buffered: bool
+    ):
+        """
+        Sets the element-serialisers and buffering mode of this serialiser.
+
+        :param element_serialisers:     The serialiser for each element of the tuple.
+        :param buffered:                Whether to serialise the elements to memory first.
+        """
         self._element_serialisers = element_serialisers
+        self._num_elements: int = len(element_serialisers)
+        self._buffered: bool = buffered
+
+        # Create the functions which (de)serialise the elements, specialised to the
+        # element-serialisers as the schema is fixed from here on
+        self._serialise_elements, self._deserialise_elements = _generate_element_functions(element_serialisers)
 
     def _check(
             self,
             obj: TupleType
     ):
-        # Must be a dictionary
+        # Must be a tuple
         if not isinstance(obj, tuple):
-            raise ValueError(f"{TupleSerialiser.__class__.__name__} serialises tuples")
+            raise ValueError(f"{TupleSerialiser.__name__} serialises tuples")
 
         # Must have the same number of elements as we have element-serialisers
-        num_required_elements = len(self._element_serialisers)
-        num_received_elements = len(obj)
-        if num_received_elements != num_required_elements:
-            raise ValueError(f"Expected tuple of {num_required_elements} elements but received {num_received_elements}")
+        if len(obj) != self._num_elements:
+            raise ValueError(f"Expected tuple of {self._num_elements} elements but received {len(obj)}")
 
     def _serialise(
             self,
             obj: TupleType,
             stream: IO[bytes]
     ):
+        # Collect the serialised values in memory if buffering
+        target = BytesIO() if self._buffered else stream
+
         # Serialise each value in turn
-        for value, serialiser in zip(obj, self._element_serialisers):
-            serialiser.serialise(value, stream)
+        self._serialise_elements(obj, target)
+
+        # Write the buffered values with a single write
+        if target is not stream:
+            stream.write(target.getbuffer())
 
     def _deserialise(
             self,
             stream: IO[bytes]
     ) -> TupleType:
         # Deserialise the elements in serialised order
-        return tuple(
-            serialiser.deserialise(stream)
-            for serialiser in self._element_serialisers
-        )
+        return self._deserialise_elements(stream)
+
+
+def _generate_element_functions(
+        element_serialisers: Tuple[Serialiser, ...]
+) -> Tuple[Callable[[tuple, IO[bytes]], None], Callable[[IO[bytes]], tuple]]:
+    """
+    Creates the functions which serialise the elements of a tuple to a stream, and
+    deserialise them from a stream into a tuple, using the given element-serialisers.
+    For small tuples, the functions are generated with the call to each element's
+    serialiser unrolled into straight-line code.
+
+    :param element_serialisers:     The serialiser for each element of the tuple.
+    :return:                        The serialisation and deserialisation functions.
+    """
+    # Bind the element-serialisers' methods once, rather than on every call
+    serialise_functions = tuple(serialiser.serialise for serialiser in element_serialisers)
+    deserialise_functions = tuple(serialiser.deserialise for serialiser in element_serialisers)
+
+    # Large tuples loop over the element-serialisers
+    num_elements = len(element_serialisers)
+    if num_elements > _MAX_GENERATED_ELEMENTS:
+        def serialise_elements(obj: tuple, stream: IO[bytes]):
+            # Indexing is quicker than creating and stepping a zip of the two
+            for index in range(num_elements):
+                serialise_functions[index](obj[index], stream)
+
+        def deserialise_elements(stream: IO[bytes]) -> tuple:
+            # Gathering the elements with a list comprehension is quicker
+            # than stepping a generator for each element
+            return tuple([deserialise(stream) for deserialise in deserialise_functions])
+
+        return serialise_elements, deserialise_elements
+
+    # The scope the generated code executes in
+    scope = {}
+    for index in range(num_elements):
+        scope[f"serialise_{index}"] = serialise_functions[index]
+        scope[f"deserialise_{index}"] = deserialise_functions[index]
+
+    # Unpack the tuple and serialise each value in turn
+    lines: List[str] = ["def serialise_elements(obj, stream):"]
+    if num_elements > 0:
+        lines.append(f"    {''.join(f'value_{index}, ' for index in range(num_elements))}= obj")
+        lines += [f"    serialise_{index}(value_{index}, stream)" for index in range(num_elements)]
+    else:
+        lines.append("    pass")
+
+    # Deserialise each value in turn directly into a tuple display
+    lines += [
+        "def deserialise_elements(stream):",
+        f"    return ({''.join(f'deserialise_{index}(stream), ' for index in range(num_elements))})"
+    ]
+
+    # Execute the function definition code
+    exec("\n".join(lines), scope)
+
+    return scope["serialise_elements"], scope["deserialise_elements"]
@@ -1,2 +1,2 @@
 from ._functions import lower_quartile, lower_quartile_sorted, upper_quartile, upper_quartile_sorted, \
-    interquartile_range
+    quartiles, quartiles_sorted, interquartile_range
@@ -1,6 +1,23 @@
 from numbers import Real
-from statistics import median
-from typing import Iterable, Sequence
+from random import Random
+from statistics import StatisticsError
+from typing import Iterable, Sequence, Tuple, List, Optional
+
+# The number of values above which quartiles of unsorted data are found by
+# bracketing them using a random sample, instead of sorting all of the data
+_BRACKETING_THRESHOLD: int = 4096
+
+# Data which is already mostly in (ascending or descending) order sorts in close
+# to linear time, which is quicker than bracketing. Such data is detected by the
+# fraction of a sample of adjacent pairs which are in the same order. This trades
+# some speed on data which is only partly in order (where bracketing a single
+# quartile would still have been quicker) for not regressing on ordered data
+_NEARLY_ORDERED_SAMPLE_SIZE: int = 256
+_NEARLY_ORDERED_FRACTION: float = 0.85
+
+# The source of randomness for sampling (kept separate so as not to disturb
+# the global random state)
+_random = Random()
 
 
 def lower_quartile(data: Iterable[Real]) -> Real:
@@ -10,9 +27,7 @@ def lower_quartile(data: Iterable[Real]) -> Real:
     :param data:    The real values to calculate the lower quartile of.
     :return:        The lower quartile.
     """
-    ordered = sorted(data)
-
-    return lower_quartile_sorted(ordered)
+    return _quartile(list(data), True)
 
 
 def lower_quartile_sorted(data: Sequence[Real]) -> Real:
@@ -22,7 +37,7 @@ def lower_quartile_sorted(data: Sequence[Real]) -> Real:
     :param data:    The sorted real values to calculate the lower quartile of.
     :return:        The lower quartile.
     """
-    return median(data[:len(data) // 2])
+    return _median_sorted(data, 0, len(data) // 2)
 
 
 def upper_quartile(data: Iterable[Real]) -> Real:
@@ -32,9 +47,7 @@ def upper_quartile(data: Iterable[Real]) -> Real:
     :param data:    The real values to calculate the upper quartile of.
     :return:        The upper quartile.
     """
-    ordered = sorted(data)
-
-    return upper_quartile_sorted(ordered)
+    return _quartile(list(data), False)
 
 
 def upper_quartile_sorted(data: Sequence[Real]) -> Real:
@@ -44,7 +57,37 @@ def upper_quartile_sorted(data: Sequence[Real]) -> Real:
     :param data:    The sorted real values to calculate the upper quartile of.
     :return:        The upper quartile.
     """
-    return median(data[-len(data) // 2:])
+    return _median_sorted(data, len(data) // 2, len(data))
+
+
+def quartiles(data: Iterable[Real]) -> Tuple[Real, Real]:
+    """
+    Calculates both the lower and upper quartiles of an iterable of real
+    values, sorting the values only once.
+
+    :param data:    The real values to calculate the quartiles of.
+    :return:        The lower and upper quartiles.
+    """
+    data = list(data)
+
+    # Bracketing each quartile separately takes twice as many passes over the
+    # data as bracketing one, so only sort once for all but very large data
+    if len(data) < 8 * _BRACKETING_THRESHOLD or _is_nearly_ordered(data):
+        data.sort()
+        return quartiles_sorted(data)
+
+    return _quartile(data, True), _quartile(data, False)
+
+
+def quartiles_sorted(data: Sequence[Real]) -> Tuple[Real, Real]:
+    """
+    Calculates both the lower and upper quartiles of a sorted sequence
+    of real values.
+
+    :param data:    The sorted real values to calculate the quartiles of.
+    :return:        The lower and upper quartiles.
+    """
+    return lower_quartile_sorted(data), upper_quartile_sorted(data)
 
 
 def interquartile_range(data: Iterable[Real]) -> Real:
@@ -54,6 +97,112 @@ def interquartile_range(data: Iterable[Real]) -> Real:
     :param data:    The real values to calculate the inter-quartile range from.
     :return:        The upper quartile.
     """
-    ordered = sorted(data)
+    lower, upper = quartiles(data)
+
+    return upper - lower
+
+
+def _median_sorted(data: Sequence[Real], start: int, stop: int) -> Real:
+    """
+    Calculates the median of a range of a sorted sequence of real values.
+    Equivalent to statistics.median of data[start:stop], but without copying
+    out the range or re-sorting the values.
+
+    :param data:                The sorted real values.
+    :param start:               The start index of the range to calculate the median of.
+    :param stop:                The (exclusive) stop index of the range.
+    :return:                    The median.
+    :raises StatisticsError:    If the range is empty.
+    """
+    num_values = stop - start
+
+    if num_values <= 0:
+        raise StatisticsError("no median for empty data")
+
+    middle = start + num_values // 2
+
+    return data[middle] if num_values % 2 == 1 else (data[middle - 1] + data[middle]) / 2
+
+
+def _quartile(data: List[Real], lower: bool) -> Real:
+    """
+    Calculates the lower or upper quartile of a list of unsorted real values.
+    The list may be reordered.
+
+    :param data:    The real values to calculate the quartile of.
+    :param lower:   Whether to calculate the lower (True) or upper (False) quartile.
+    :return:        The quartile.
+    """
+    num_values = len(data)
+
+    # The quartile is the median of the lower/upper half of the sorted values, which
+    # is the middle value of that half, or the mean of its middle two values
+    if num_values >= _BRACKETING_THRESHOLD and not _is_nearly_ordered(data):
+        half_start, half_length = (0, num_values // 2) if lower else (num_values // 2, num_values - num_values // 2)
+        middle = _order_statistics(data, half_start + (half_length - 1) // 2, 2 - half_length % 2)
+        if middle is not None:
+            return _median_sorted(middle, 0, len(middle))
+
+    # Otherwise sort all of the values
+    data.sort()
 
-    return upper_quartile_sorted(ordered) - lower_quartile_sorted(ordered)
+    return lower_quartile_sorted(data) if lower else upper_quartile_sorted(data)
+
+
+def _is_nearly_ordered(data: List[Real]) -> bool:
+    """
+    Estimates whether a list of at least two real values is mostly in ascending
+    or descending order, from a sample of evenly-spaced adjacent pairs of values.
+
+    :param data:    The real values.
+    :return:        Whether the values are mostly in order.
+    """
+    step = max(1, (len(data) - 1) // _NEARLY_ORDERED_SAMPLE_SIZE)
+    positions = range(0, len(data) - 1, step)
+    num_ascending = len([None for position in positions if data[position] <= data[position + 1]])
+    num_in_order = max(num_ascending, len(positions) - num_ascending)
+
+    return num_in_order >= _NEARLY_ORDERED_FRACTION * len(positions)
+
+
+def _order_statistics(data: List[Real], first: int, count: int) -> Optional[List[Real]]:
+    """
+    Finds the values at a given range of positions in the sorted order of some
+    unsorted values, without sorting all of the values. Instead, a random sample
+    of the values is sorted to estimate the range of values containing the positions,
+    and only the values in that range are sorted.
+
+    :param data:    The unsorted real values.
+    :param first:   The position of the first value to find in the sorted order.
+    :param count:   The number of consecutive values to find.
+    :return:        The values, in sorted order, or None if the sample failed to
+                    bracket them (which is unlikely).
+    """
+    num_values = len(data)
+
+    # Sort a sample of the values
+    sample_size = int(num_values ** (2 / 3))
+    sample = sorted(_random.choices(data, k=sample_size))
+
+    # Bracket the positions in the sample, with a margin of about 3 standard
+    # deviations of the sampled ranks either side
+    margin = int(1.5 * sample_size ** 0.5) + 1
+    low_index = first * sample_size // num_values - margin
+    high_index = (first + count) * sample_size // num_values + margin
+    if low_index < 0 or high_index >= sample_size:
+        return None
+    low, high = sample[low_index], sample[high_index]
+
+    # Count the values below the bracket and gather the values within it
+    num_below = len([value for value in data if value < low])
+    within = [value for value in data if low <= value <= high]
+
+    # Make sure the bracket contains the positions
+    first -= num_below
+    if first < 0 or first + count > len(within):
+        return None
+
+    # Sort just the bracketed values (in the same order a full sort would)
+    within.sort()
+
+    return within[first:first + count]
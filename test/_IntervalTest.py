@@ -86,27 +86,27 @@ class IntervalTest(AbstractTest):
     @Test
     @SubjectArgs(0, 0, False)
     def static_creators(self, subject: Interval):
-        for interval, test in {(Interval.total(), Interval.is_total),
+        for interval, test in ((Interval.total(), Interval.is_total),
                                (Interval.empty(), Interval.is_empty),
                                (Interval.open_lower(0), Interval.is_open_lower),
                                (Interval.open_upper(0), Interval.is_open_upper),
                                (Interval.singular(0), Interval.is_singular),
                                (Interval.exclude_value(0), Interval.is_exclude_value),
                                (Interval.inside(1, 0), Interval.is_inside),
-                               (Interval.outside(0, 1), Interval.is_outside)}:
+                               (Interval.outside(0, 1), Interval.is_outside)):
             with self.subTest(test=test.__name__):
                 self.assertTrue(test(interval))
 
     @Test
     @SubjectArgs(0, 0, False)
     def to_string(self, subject: Interval):
-        for interval, expected in {(Interval.total(), "[:]"),
+        for interval, expected in ((Interval.total(), "[:]"),
                                    (Interval.empty(), "(:)"),
                                    (Interval.open_lower(0, True), "[:0]"),
                                    (Interval.open_upper(0, False), "(0:]"),
                                    (Interval.singular(0), "[0]"),
                                    (Interval.exclude_value(0), "(0)"),
                                    (Interval.inside(1, 0), "[0:1)"),
-                                   (Interval.outside(0, 1, False, True), "0](1")}:
+                                   (Interval.outside(0, 1, False, True), "0](1")):
             with self.subTest(expected=expected):
                 self.assertEqual(str(interval), expected)
@@ -0,0 +1,2 @@
+from ._factorial import FactorialTest
+from ._sets import SubsetNumberTest
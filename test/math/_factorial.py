@@ -0,0 +1,40 @@
+from wai.test import AbstractTest
+from wai.test.decorators import Test, SubjectArgs
+
+from wai.common.math import factorial
+from wai.common.math.sets import number_of_subsets
+
+
+class FactorialTest(AbstractTest):
+    """
+    Tests the factorial function, including for non-int values.
+    """
+    @classmethod
+    def subject_type(cls):
+        return factorial
+
+    @Test
+    @SubjectArgs(6)
+    def full(self, subject: int):
+        self.assertEqual(subject, 720)
+
+    @Test
+    @SubjectArgs(6, 2)
+    def down_to(self, subject: int):
+        self.assertEqual(subject, 360)
+
+    @Test
+    @SubjectArgs(5.0)
+    def float_full(self, subject: float):
+        self.assertEqual(subject, 120.0)
+
+    @Test
+    @SubjectArgs(5.0, 2)
+    def float_down_to(self, subject: float):
+        self.assertEqual(subject, 60.0)
+
+    @Test
+    @SubjectArgs(0)
+    def float_number_of_subsets(self, subject: int):
+        self.assertEqual(number_of_subsets(5.0, 2.0), 10.0)
+        self.assertEqual(number_of_subsets(5.0, 2.0, True), 20.0)
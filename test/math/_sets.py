@@ -0,0 +1,42 @@
+from itertools import permutations
+from typing import List
+
+from wai.test import AbstractTest
+from wai.test.decorators import Test, SubjectArgs
+
+from wai.common.math.sets import subset_to_subset_number, subset_number_to_subset
+
+
+class SubsetNumberTest(AbstractTest):
+    """
+    Tests the encoding of subsets to subset numbers and back.
+    """
+    @classmethod
+    def subject_type(cls):
+        return subset_to_subset_number
+
+    def round_trip_test(self, set_size: int, subset: List[int], subset_number: int):
+        decoded = subset_number_to_subset(set_size, len(subset), subset_number, True)
+        self.assertEqual(decoded, subset, f"{subset_number} should decode to {subset}")
+
+    @Test
+    @SubjectArgs(10 ** 9, [999999999, 0, 123456789], True)
+    def ordered_large_set(self, subject: int):
+        self.round_trip_test(10 ** 9, [999999999, 0, 123456789], subject)
+
+    @Test
+    @SubjectArgs(10 ** 12, [5, 4, 10 ** 12 - 1, 6], True)
+    def ordered_large_set_adjacent_items(self, subject: int):
+        self.round_trip_test(10 ** 12, [5, 4, 10 ** 12 - 1, 6], subject)
+
+    @Test
+    @SubjectArgs(6, [], True)
+    def ordered_all_small_subsets(self, subject: int):
+        # The empty subset is encoded as 0
+        self.assertEqual(subject, 0)
+
+        for subset_size in range(1, 5):
+            for subset in permutations(range(6), subset_size):
+                with self.subTest(subset=subset):
+                    subset = list(subset)
+                    self.round_trip_test(6, subset, subset_to_subset_number(6, subset, True))
@@ -0,0 +1,72 @@
+from wai.test import AbstractTest
+from wai.test.decorators import Test, ExceptionTest
+
+from wai.common.meta import InstanceProperty
+
+
+# Test classes owning instance properties
+class Owner:
+    value = InstanceProperty(1)
+
+
+class SubOwner(Owner):
+    other_value = InstanceProperty(2)
+
+
+class SlotsOwner:
+    __slots__ = ("__weakref__",)
+    value = InstanceProperty(3)
+
+
+class InstancePropertyTest(AbstractTest):
+    @classmethod
+    def subject_type(cls):
+        return SubOwner
+
+    @Test
+    def default(self, subject: SubOwner):
+        self.assertEqual(subject.value, 1)
+        self.assertEqual(subject.other_value, 2)
+        self.assertEqual(Owner.value, 1)
+
+    @Test
+    def set_and_delete(self, subject: SubOwner):
+        subject.value = 10
+        subject.other_value = 20
+        self.assertEqual(subject.value, 10)
+        self.assertEqual(subject.other_value, 20)
+        self.assertEqual(SubOwner().value, 1)
+
+        del subject.value
+        self.assertEqual(subject.value, 1)
+        self.assertEqual(subject.other_value, 20)
+
+    @ExceptionTest(KeyError)
+    def delete_unset(self, subject: SubOwner):
+        del subject.value
+
+    @Test
+    def same_named_owners(self, subject: SubOwner):
+        # A sub-class with the same name and attribute name as its base (e.g. from another module)
+        same_named = type(Owner.__name__, (Owner,), {"value": InstanceProperty(4)})
+        instance = same_named()
+        instance.value = 40
+        Owner.__dict__["value"].__set__(instance, 10)
+        self.assertEqual(instance.value, 40)
+        self.assertEqual(Owner.__dict__["value"].__get__(instance, Owner), 10)
+
+    @Test
+    def shared_between_owners(self, subject: SubOwner):
+        # Giving the property to another owner doesn't lose values already set
+        subject.value = 10
+        type("OtherOwner", (), {"other_name": Owner.__dict__["value"]})
+        self.assertEqual(subject.value, 10)
+
+    @Test
+    def slots(self, subject: SubOwner):
+        instance = SlotsOwner()
+        self.assertEqual(instance.value, 3)
+        instance.value = 30
+        self.assertEqual(instance.value, 30)
+        del instance.value
+        self.assertEqual(instance.value, 3)
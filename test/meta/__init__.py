@@ -1 +1,2 @@
+from ._InstanceProperty import InstancePropertyTest
 from ._metadata import MetadataTest
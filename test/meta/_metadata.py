@@ -3,7 +3,7 @@ from typing import Tuple, Any, Dict
 from wai.test import AbstractTest
 from wai.test.decorators import Test, ExceptionTest
 
-from wai.common.meta import with_metadata, has_metadata, get_metadata
+from wai.common.meta import with_metadata, has_metadata, get_metadata, get_metadata_or
 
 
 # Test class for holding meta-data
@@ -28,3 +28,9 @@ class MetadataTest(AbstractTest):
     @ExceptionTest(KeyError)
     def get_missing_key(self, subject: TestClass):
         get_metadata(subject, "missing")
+
+    @Test
+    def get_missing_key_or_default(self, subject: TestClass):
+        self.assertEqual(get_metadata_or(subject, "test_key"), 33)
+        self.assertIsNone(get_metadata_or(subject, "missing"))
+        self.assertEqual(get_metadata_or(TestClass(), "test_key", 42), 42)
@@ -0,0 +1,70 @@
+import struct
+from io import BytesIO
+from typing import IO
+
+from wai.test import AbstractTest
+from wai.test.decorators import Test, SubjectArgs, ExceptionTest
+
+from wai.common.serialisation.serialisers import ListSerialiser, IntSerialiser, FloatSerialiser
+
+
+class OffsetIntSerialiser(IntSerialiser):
+    """
+    Int serialiser which stores each value offset by one.
+    """
+    def _serialise(self, obj: int, stream: IO[bytes]):
+        super()._serialise(obj + 1, stream)
+
+    def _deserialise(self, stream: IO[bytes]) -> int:
+        return super()._deserialise(stream) - 1
+
+
+class ListSerialiserTest(AbstractTest):
+    """
+    Tests the ListSerialiser class.
+    """
+    @classmethod
+    def subject_type(cls):
+        return ListSerialiser
+
+    def round_trip_test(self, subject: ListSerialiser, value: list):
+        serialised = subject.serialise_to_bytes(value)
+        self.assertEqual(subject.deserialise_from_bytes(serialised), value)
+
+    @Test
+    @SubjectArgs(IntSerialiser())
+    def int_list(self, subject: ListSerialiser):
+        self.round_trip_test(subject, [0, 1, -1, 2 ** 31 - 1, -2 ** 31])
+        self.round_trip_test(subject, [])
+
+    @Test
+    @SubjectArgs(IntSerialiser(little_endian=False, num_bytes=3, signed=False))
+    def unsupported_size_int_list(self, subject: ListSerialiser):
+        self.round_trip_test(subject, [0, 1, 2 ** 24 - 1])
+
+    @Test
+    @SubjectArgs(FloatSerialiser(little_endian=False, double_precision=False))
+    def float_list(self, subject: ListSerialiser):
+        self.round_trip_test(subject, [0.0, 1.5, -2.25])
+
+    @Test
+    @SubjectArgs(OffsetIntSerialiser())
+    def element_subclass(self, subject: ListSerialiser):
+        self.round_trip_test(subject, [0, 1, 2])
+        self.assertEqual(subject.serialise_to_bytes([0]), IntSerialiser(signed=False).serialise_to_bytes(1) +
+                         IntSerialiser().serialise_to_bytes(1))
+
+    @Test
+    @SubjectArgs(IntSerialiser())
+    def truncated_int_list(self, subject: ListSerialiser):
+        # Missing values are read the same way as when reading a single int
+        serialised = subject.serialise_to_bytes([1, 2, 3])[:-2]
+        stream = BytesIO(serialised[4:])
+        expected = [IntSerialiser().deserialise(stream) for _ in range(3)]
+        self.assertEqual(subject.deserialise_from_bytes(serialised), expected)
+
+    @ExceptionTest(struct.error)
+    @SubjectArgs(FloatSerialiser())
+    def truncated_float_list(self, subject: ListSerialiser):
+        serialised = subject.serialise_to_bytes([1.0, 2.0, 3.0])[:-2]
+        subject.deserialise_from_bytes(serialised)
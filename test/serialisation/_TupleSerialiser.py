@@ -0,0 +1,67 @@
+import pickle
+from copy import deepcopy
+
+from wai.test import AbstractTest
+from wai.test.decorators import Test, SubjectArgs
+
+from wai.common.serialisation.serialisers import TupleSerialiser, IntSerialiser, LengthPrefixedStringSerialiser
+
+
+class IntPairSerialiser(TupleSerialiser):
+    """
+    Sub-type of TupleSerialiser with a different __init__ signature.
+    """
+    def __init__(self, name: str):
+        super().__init__(IntSerialiser(), IntSerialiser(num_bytes=2))
+        self.name = name
+
+
+class TupleSerialiserTest(AbstractTest):
+    """
+    Tests the TupleSerialiser class.
+    """
+    @classmethod
+    def subject_type(cls):
+        return TupleSerialiser
+
+    def round_trip_test(self, subject: TupleSerialiser, value: tuple):
+        serialised = subject.serialise_to_bytes(value)
+        self.assertEqual(subject.deserialise_from_bytes(serialised), value)
+
+    @Test
+    @SubjectArgs(IntSerialiser(), LengthPrefixedStringSerialiser())
+    def standard_tuple(self, subject: TupleSerialiser):
+        self.round_trip_test(subject, (3, "abc"))
+
+    @Test
+    @SubjectArgs(*(IntSerialiser() for _ in range(20)))
+    def large_tuple(self, subject: TupleSerialiser):
+        self.round_trip_test(subject, tuple(range(20)))
+
+    @Test
+    @SubjectArgs(IntSerialiser(), LengthPrefixedStringSerialiser(), buffered=True)
+    def pickle_round_trip(self, subject: TupleSerialiser):
+        unpickled = pickle.loads(pickle.dumps(subject))
+        self.assertEqual(unpickled.serialise_to_bytes((3, "abc")), subject.serialise_to_bytes((3, "abc")))
+        self.round_trip_test(unpickled, (3, "abc"))
+
+    @Test
+    @SubjectArgs(IntSerialiser(), IntSerialiser(num_bytes=2))
+    def deepcopy_uses_copied_serialisers(self, subject: TupleSerialiser):
+        copied = deepcopy(subject)
+        self.round_trip_test(copied, (3, 4))
+
+        # Changing the copy's element-serialisers must not affect the original
+        copied._element_serialisers[1]._num_bytes = 8
+        self.assertEqual(len(copied.serialise_to_bytes((3, 4))), 12)
+        self.assertEqual(len(subject.serialise_to_bytes((3, 4))), 6)
+
+    @Test
+    @SubjectArgs(IntSerialiser(), IntSerialiser(num_bytes=2))
+    def pickle_sub_type(self, subject: TupleSerialiser):
+        original = IntPairSerialiser("pair")
+        for restored in (pickle.loads(pickle.dumps(original)), deepcopy(original)):
+            self.assertIs(type(restored), IntPairSerialiser)
+            self.assertEqual(restored.name, "pair")
+            self.assertEqual(restored.serialise_to_bytes((3, 4)), subject.serialise_to_bytes((3, 4)))
+            self.round_trip_test(restored, (3, 4))
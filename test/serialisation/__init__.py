@@ -0,0 +1,2 @@
+from ._ListSerialiser import ListSerialiserTest
+from ._TupleSerialiser import TupleSerialiserTest
@@ -0,0 +1 @@
+from ._quartiles import QuartilesTest
@@ -0,0 +1,69 @@
+from random import Random
+from statistics import median
+from typing import List, Tuple
+from unittest.mock import patch
+
+from wai.test import AbstractTest
+from wai.test.decorators import Test, SubjectArgs
+
+from wai.common.statistics import lower_quartile, upper_quartile, quartiles
+from wai.common.statistics import _functions
+
+# Enough values to bracket each quartile, and both quartiles in quartiles()
+_NUM_VALUES: int = 40001
+
+_random = Random(42)
+_RANDOM_DATA: List[float] = [_random.random() for _ in range(_NUM_VALUES)]
+_NEARLY_SORTED_DATA: List[float] = sorted(_RANDOM_DATA)
+for _ in range(_NUM_VALUES // 100):
+    _i, _j = _random.randrange(_NUM_VALUES), _random.randrange(_NUM_VALUES)
+    _NEARLY_SORTED_DATA[_i], _NEARLY_SORTED_DATA[_j] = _NEARLY_SORTED_DATA[_j], _NEARLY_SORTED_DATA[_i]
+
+
+class _MissingRandom(Random):
+    """
+    Source of randomness which always samples the same value, so the
+    sample never brackets the quartiles.
+    """
+    def choices(self, population, weights=None, *, cum_weights=None, k=1):
+        return [population[0]] * k
+
+
+class QuartilesTest(AbstractTest):
+    """
+    Tests the quartile functions against the quartiles of the sorted data.
+    """
+    @classmethod
+    def subject_type(cls):
+        return quartiles
+
+    def check_quartiles(self, data: List[float], subject: Tuple[float, float]):
+        ordered = sorted(data)
+        expected = median(ordered[:len(ordered) // 2]), median(ordered[len(ordered) // 2:])
+        self.assertEqual(subject, expected)
+        self.assertEqual(lower_quartile(data), expected[0])
+        self.assertEqual(upper_quartile(data), expected[1])
+
+    @Test
+    @SubjectArgs(_RANDOM_DATA)
+    def random_data(self, subject: Tuple[float, float]):
+        self.check_quartiles(_RANDOM_DATA, subject)
+
+    @Test
+    @SubjectArgs(_RANDOM_DATA[:-1])
+    def random_data_even_length(self, subject: Tuple[float, float]):
+        self.check_quartiles(_RANDOM_DATA[:-1], subject)
+
+    @Test
+    @SubjectArgs(_NEARLY_SORTED_DATA)
+    def nearly_sorted_data(self, subject: Tuple[float, float]):
+        self.check_quartiles(_NEARLY_SORTED_DATA, subject)
+
+    @Test
+    @SubjectArgs(_RANDOM_DATA)
+    def failed_bracketing(self, subject: Tuple[float, float]):
+        # Falls back to sorting when the sample misses the quartiles
+        with patch.object(_functions, "_random", _MissingRandom()):
+            self.assertIsNone(_functions._order_statistics(list(_RANDOM_DATA), _NUM_VALUES // 4, 1))
+            self.check_quartiles(_RANDOM_DATA, quartiles(_RANDOM_DATA))
+        self.check_quartiles(_RANDOM_DATA, subject)